@@ -20,7 +20,7 @@ import {
   TestServiceConstructor,
 } from './fixtures/services';
 import { UNCAUGHT_ERROR } from '../router/result';
-import { codecs } from '../codec/codec.test';
+import { codecs } from './fixtures/codec';
 import { WebSocketClientTransport } from '../transport/impls/ws/client';
 import { WebSocketServerTransport } from '../transport/impls/ws/server';
 import { testFinishesCleanly } from './fixtures/cleanup';
@@ -113,21 +113,18 @@ describe.each(codecs)(
       input.push({ msg: 'end', ignore: false, end: true });
       input.end();
 
-      const result1 = await iterNext(output);
-      assert(result1.ok);
-      expect(result1.payload).toStrictEqual({ response: 'abc' });
-
-      const result2 = await iterNext(output);
-      assert(result2.ok);
-      expect(result2.payload).toStrictEqual({ response: 'ghi' });
-
-      const result3 = await iterNext(output);
-      assert(result3.ok);
-      expect(result3.payload).toStrictEqual({ response: 'end' });
+      // the server ends the stream after 'end', which ends the client stream too,
+      // so we can collect everything in one go rather than stepping through it
+      const results = [];
+      for await (const result of output) {
+        results.push(result);
+      }
 
-      // after the server stream is ended, the client stream should be ended too
-      const result4 = await output.next();
-      assert(result4.done);
+      expect(results).toStrictEqual([
+        { ok: true, payload: { response: 'abc' } },
+        { ok: true, payload: { response: 'ghi' } },
+        { ok: true, payload: { response: 'end' } },
+      ]);
 
       close();
       await testFinishesCleanly({
@@ -356,8 +353,9 @@ describe.each(codecs)(
         promises.push(client.test.add.rpc({ n: i }));
       }
 
+      const results = await Promise.all(promises);
       for (let i = 0; i < CONCURRENCY; i++) {
-        const result = await promises[i];
+        const result = results[i];
         assert(result.ok);
         expect(result.payload).toStrictEqual({ n: i });
       }
@@ -384,16 +382,18 @@ describe.each(codecs)(
         openStreams.push(streamHandle);
       }
 
-      for (let i = 0; i < CONCURRENCY; i++) {
-        const output = openStreams[i][1];
-        const result1 = await iterNext(output);
-        assert(result1.ok);
-        expect(result1.payload).toStrictEqual({ response: `${i}-1` });
-
-        const result2 = await iterNext(output);
-        assert(result2.ok);
-        expect(result2.payload).toStrictEqual({ response: `${i}-2` });
-      }
+      // read from all streams at once rather than draining them one after another
+      await Promise.all(
+        openStreams.map(async ([_input, output], i) => {
+          const result1 = await iterNext(output);
+          assert(result1.ok);
+          expect(result1.payload).toStrictEqual({ response: `${i}-1` });
+
+          const result2 = await iterNext(output);
+          assert(result2.ok);
+          expect(result2.payload).toStrictEqual({ response: `${i}-2` });
+        }),
+      );
 
       // cleanup
       for (let i = 0; i < CONCURRENCY; i++) {
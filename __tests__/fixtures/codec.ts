@@ -0,0 +1,7 @@
+import { BinaryCodec } from '../../codec/binary';
+import { NaiveJsonCodec } from '../../codec/json';
+
+export const codecs = [
+  { name: 'naive', codec: NaiveJsonCodec },
+  { name: 'binary', codec: BinaryCodec },
+];
@@ -1,15 +1,20 @@
-import { decode, encode } from '@msgpack/msgpack';
+import { Decoder, Encoder } from '@msgpack/msgpack';
 import { Codec } from './types';
 
+// reuse one encoder/decoder rather than letting encode/decode build
+// (and size up their scratch buffers) from scratch on every message
+const encoder = new Encoder();
+const decoder = new Decoder();
+
 /**
  * Binary codec, uses [msgpack](https://www.npmjs.com/package/@msgpack/msgpack) under the hood
  * @type {Codec}
  */
 export const BinaryCodec: Codec = {
-  toBuffer: encode,
+  toBuffer: (obj: object) => encoder.encode(obj),
   fromBuffer: (buff: Uint8Array) => {
     try {
-      const res = decode(buff);
+      const res = decoder.decode(buff);
       if (typeof res !== 'object') {
         return null;
       }
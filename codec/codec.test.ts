@@ -1,11 +1,6 @@
-import { BinaryCodec } from './binary';
-import { NaiveJsonCodec } from './json';
 import { describe, test, expect } from 'vitest';
-
-export const codecs = [
-  { name: 'naive', codec: NaiveJsonCodec },
-  { name: 'binary', codec: BinaryCodec },
-];
+import { codecs } from '../__tests__/fixtures/codec';
+import { NaiveJsonCodec } from './json';
 
 describe.each(codecs)('codec -- $name', ({ codec }) => {
   test('empty object', () => {
@@ -37,6 +32,39 @@ describe.each(codecs)('codec -- $name', ({ codec }) => {
     expect(codec.fromBuffer(codec.toBuffer(msg))).toStrictEqual(msg);
   });
 
+  test('large buffer test', () => {
+    const buff = new Uint8Array(100_000);
+    for (let i = 0; i < buff.length; i++) {
+      buff[i] = i % 256;
+    }
+
+    const msg = { buff };
+    expect(codec.fromBuffer(codec.toBuffer(msg))).toStrictEqual(msg);
+  });
+
+  test('string containing the binary marker', () => {
+    const msg = { text: 'a "$t" b', nested: { tagged: '{"$t":"AQID"}' } };
+    expect(codec.fromBuffer(codec.toBuffer(msg))).toStrictEqual(msg);
+  });
+
+  test('empty and nested buffers', () => {
+    const msg = {
+      empty: new Uint8Array(0),
+      list: [
+        Uint8Array.from([1, 2, 3]),
+        'abc',
+        { inner: Uint8Array.from([4]) },
+      ],
+      nested: { deeply: { buff: Uint8Array.from([5, 6]) } },
+    };
+    expect(codec.fromBuffer(codec.toBuffer(msg))).toStrictEqual(msg);
+  });
+
+  test('array of buffers', () => {
+    const msg = { list: [new Uint8Array(0), Uint8Array.from([255])] };
+    expect(codec.fromBuffer(codec.toBuffer(msg))).toStrictEqual(msg);
+  });
+
   test('invalid json returns null', () => {
     expect(codec.fromBuffer(Buffer.from(''))).toBeNull();
     expect(codec.fromBuffer(Buffer.from('['))).toBeNull();
@@ -44,3 +72,23 @@ describe.each(codecs)('codec -- $name', ({ codec }) => {
     expect(codec.fromBuffer(Buffer.from('{"a":1}[]'))).toBeNull();
   });
 });
+
+describe('naive json codec', () => {
+  test('decoded buffers own their memory', () => {
+    const msg = { buff: Uint8Array.from([0, 42, 100, 255]) };
+    const encoded = NaiveJsonCodec.toBuffer(msg);
+    const decoded = NaiveJsonCodec.fromBuffer(encoded) as typeof msg;
+    expect(decoded.buff).toStrictEqual(msg.buff);
+    expect(decoded.buff.buffer.byteLength).toEqual(decoded.buff.byteLength);
+  });
+
+  test('malformed binary returns null', () => {
+    const decode = (text: string) =>
+      NaiveJsonCodec.fromBuffer(Buffer.from(text));
+    expect(decode('{"buff":{"$t":"not base64!"}}')).toBeNull();
+    expect(decode('{"buff":{"$t":"AQI"}}')).toBeNull();
+    expect(decode('{"buff":{"$t":"AQ=="}}')).toStrictEqual({
+      buff: Uint8Array.from([1]),
+    });
+  });
+});
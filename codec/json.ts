@@ -3,17 +3,54 @@ import { Codec } from './types';
 const encoder = new TextEncoder();
 const decoder = new TextDecoder();
 
+// large enough to amortize the call overhead but small enough to stay well
+// under engine limits on the number of arguments to a single call
+const BASE64_CHUNK_SIZE = 0x8000;
+
+// Buffer only exists in node, where its native base64 support is much faster than
+// building up a binary string for btoa/atob. browsers take the fallback paths below
+const NodeBuffer = (globalThis as { Buffer?: typeof Buffer }).Buffer;
+
 // Convert Uint8Array to base64
 function uint8ArrayToBase64(uint8Array: Uint8Array) {
+  if (NodeBuffer) {
+    return NodeBuffer.from(
+      uint8Array.buffer,
+      uint8Array.byteOffset,
+      uint8Array.byteLength,
+    ).toString('base64');
+  }
+
   let binary = '';
-  uint8Array.forEach((byte) => {
-    binary += String.fromCharCode(byte);
-  });
+  for (let i = 0; i < uint8Array.length; i += BASE64_CHUNK_SIZE) {
+    binary += String.fromCharCode.apply(
+      null,
+      // subarray is a view, this doesn't copy the underlying bytes
+      uint8Array.subarray(i, i + BASE64_CHUNK_SIZE) as unknown as number[],
+    );
+  }
+
   return btoa(binary);
 }
 
+// canonical padded base64, which is all uint8ArrayToBase64 ever produces
+const BASE64_PATTERN =
+  /^(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?$/;
+
 // Convert base64 to Uint8Array
 function base64ToUint8Array(base64: string) {
+  // Buffer.from silently skips invalid characters while atob throws on them,
+  // validate up front so malformed input is rejected the same way everywhere
+  if (!BASE64_PATTERN.test(base64)) {
+    throw new Error('invalid base64');
+  }
+
+  if (NodeBuffer) {
+    // small buffers are slices of node's shared pool, copy into a plain Uint8Array
+    // so callers never see a Buffer or the unrelated bytes around it
+    return new Uint8Array(NodeBuffer.from(base64, 'base64'));
+  }
+
   const binaryString = atob(base64);
   const uint8Array = new Uint8Array(binaryString.length);
   for (let i = 0; i < binaryString.length; i++) {
@@ -22,12 +59,71 @@ function base64ToUint8Array(base64: string) {
   return uint8Array;
 }
 
+// the key we wrap binary payloads in, as it appears in serialized JSON
+const BINARY_MARKER = '"$t"';
+
+// walks a freshly parsed tree and swaps tagged binary objects for Uint8Arrays.
+// this is much cheaper than a JSON.parse reviver, which is called for every
+// single value including primitives
+function reviveBinary(val: unknown): unknown {
+  if (typeof val !== 'object' || val === null) {
+    return val;
+  }
+
+  // an empty buffer is tagged with an empty string, so check the type rather than truthiness
+  const tagged = val as { $t?: unknown };
+  if (typeof tagged.$t === 'string') {
+    return base64ToUint8Array(tagged.$t);
+  }
+
+  const obj = val as Record<string, unknown>;
+  for (const key of Object.keys(obj)) {
+    const child = obj[key];
+    const revived = reviveBinary(child);
+    if (revived !== child) {
+      // define rather than assign so keys like `__proto__` stay plain data
+      Object.defineProperty(obj, key, {
+        value: revived,
+        writable: true,
+        enumerable: true,
+        configurable: true,
+      });
+    }
+  }
+
+  return val;
+}
+
+function containsBinary(val: unknown): boolean {
+  if (typeof val !== 'object' || val === null) {
+    return false;
+  }
+
+  if (val instanceof Uint8Array) {
+    return true;
+  }
+
+  for (const key in val) {
+    if (containsBinary((val as Record<string, unknown>)[key])) {
+      return true;
+    }
+  }
+
+  return false;
+}
+
 /**
  * Naive JSON codec implementation using JSON.stringify and JSON.parse.
  * @type {Codec}
  */
 export const NaiveJsonCodec: Codec = {
   toBuffer: (obj: object) => {
+    // a replacer gets called for every value in the tree, which is much slower than
+    // plain JSON.stringify, so only use it when there is binary to encode
+    if (!containsBinary(obj)) {
+      return encoder.encode(JSON.stringify(obj));
+    }
+
     return encoder.encode(
       JSON.stringify(obj, function replacer(key) {
         let val = this[key];
@@ -41,13 +137,14 @@ export const NaiveJsonCodec: Codec = {
   },
   fromBuffer: (buff: Uint8Array) => {
     try {
-      return JSON.parse(decoder.decode(buff), function reviver(_key, val) {
-        if (val?.$t) {
-          return base64ToUint8Array(val.$t);
-        } else {
-          return val;
-        }
-      });
+      const text = decoder.decode(buff);
+      const parsed = JSON.parse(text);
+      // most messages don't carry binary so only walk the tree when the marker is actually present
+      if (!text.includes(BINARY_MARKER)) {
+        return parsed;
+      }
+
+      return reviveBinary(parsed) as object;
     } catch {
       return null;
     }
@@ -11,6 +11,8 @@ export interface Codec {
   toBuffer(obj: object): Uint8Array;
   /**
    * Decodes an object from a Uint8 buffer.
+   * The returned object must be newly created on every call and not shared or
+   * cached, as the transport takes ownership of it and may modify it in place.
    * @param buf - The Uint8 buffer to decode.
    * @returns The decoded object, or null if decoding failed.
    */
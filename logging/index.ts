@@ -50,6 +50,17 @@ export function bindLogger(write: (msg: string) => void, color?: boolean) {
   };
 }
 
+/**
+ * Whether messages at the given level would actually be written. Use this to skip building
+ * expensive log messages (e.g. serializing a whole message) on hot paths.
+ * @param level - The logging level to check.
+ */
+export function isLevelEnabled(level: LoggingLevel) {
+  return (
+    log !== undefined && LoggingLevels[log.minLevel] <= LoggingLevels[level]
+  );
+}
+
 /**
  * Sets the minimum logging level for the logger.
  * @param level - The minimum logging level to set.
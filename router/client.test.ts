@@ -0,0 +1,83 @@
+import { describe, test, expect, vi } from 'vitest';
+import stream from 'node:stream';
+import { addStreamListener, removeStreamListener } from './client';
+import { StdioTransport } from '../transport/impls/stdio/stdio';
+import { OpaqueTransportMessage } from '../transport/message';
+import { payloadToTransportMessage } from '../util/testHelpers';
+
+function createTransport() {
+  return new StdioTransport(
+    'client',
+    new stream.PassThrough(),
+    new stream.PassThrough(),
+  );
+}
+
+function dispatch(
+  transport: StdioTransport,
+  streamId: string,
+  to = transport.clientId,
+) {
+  const msg = payloadToTransportMessage({}, streamId, 'SERVER', to);
+  transport.eventDispatcher.dispatchEvent('message', msg);
+  return msg;
+}
+
+describe('stream listeners', () => {
+  test('messages only reach the handler for their stream', async () => {
+    const transport = createTransport();
+    const onA = vi.fn();
+    const onB = vi.fn();
+    addStreamListener(transport, 'a', onA);
+    addStreamListener(transport, 'b', onB);
+    expect(transport.eventDispatcher.numberOfListeners('message')).toEqual(1);
+
+    const msg = dispatch(transport, 'a');
+    expect(onA).toHaveBeenCalledTimes(1);
+    expect(onA).toHaveBeenCalledWith(msg);
+    expect(onB).toHaveBeenCalledTimes(0);
+
+    // unknown stream
+    dispatch(transport, 'c');
+    // right stream but addressed to someone else
+    dispatch(transport, 'a', 'someoneElse');
+    expect(onA).toHaveBeenCalledTimes(1);
+    expect(onB).toHaveBeenCalledTimes(0);
+
+    removeStreamListener(transport, 'a');
+    expect(transport.eventDispatcher.numberOfListeners('message')).toEqual(1);
+    removeStreamListener(transport, 'b');
+    expect(transport.eventDispatcher.numberOfListeners('message')).toEqual(0);
+
+    dispatch(transport, 'a');
+    dispatch(transport, 'b');
+    expect(onA).toHaveBeenCalledTimes(1);
+    expect(onB).toHaveBeenCalledTimes(0);
+    await transport.close();
+  });
+
+  test('listener is detached when the last stream closes during dispatch', async () => {
+    const transport = createTransport();
+    const onMessage = vi.fn((msg: OpaqueTransportMessage) =>
+      removeStreamListener(transport, msg.streamId),
+    );
+    addStreamListener(transport, 'a', onMessage);
+    expect(transport.eventDispatcher.numberOfListeners('message')).toEqual(1);
+
+    dispatch(transport, 'a');
+    expect(onMessage).toHaveBeenCalledTimes(1);
+    expect(transport.eventDispatcher.numberOfListeners('message')).toEqual(0);
+
+    dispatch(transport, 'a');
+    expect(onMessage).toHaveBeenCalledTimes(1);
+
+    // a new stream after that gets a fresh listener
+    const onB = vi.fn();
+    addStreamListener(transport, 'b', onB);
+    dispatch(transport, 'b');
+    expect(onB).toHaveBeenCalledTimes(1);
+    removeStreamListener(transport, 'b');
+    expect(transport.eventDispatcher.numberOfListeners('message')).toEqual(0);
+    await transport.close();
+  });
+});
@@ -224,6 +224,63 @@ export const createClient = <Srv extends Server<ServiceDefs>>(
     }
   }, []) as ServerClient<Srv>;
 
+type StreamMessageHandler = (msg: OpaqueTransportMessage) => void;
+
+interface StreamRouter {
+  handlers: Map<string, StreamMessageHandler>;
+  onMessage: (msg: OpaqueTransportMessage) => void;
+}
+
+// a single message listener per transport that routes to the right stream by id
+// so that each incoming message doesn't get fanned out to every open stream.
+// handlers registered here only ever see messages addressed to us for their own stream
+const streamRouters = new WeakMap<Transport<Connection>, StreamRouter>();
+
+export function addStreamListener(
+  transport: Transport<Connection>,
+  streamId: string,
+  handler: StreamMessageHandler,
+) {
+  let router = streamRouters.get(transport);
+  if (!router) {
+    const handlers = new Map<string, StreamMessageHandler>();
+    const clientId = transport.clientId;
+    router = {
+      handlers,
+      onMessage: (msg) => {
+        if (msg.to !== clientId) {
+          return;
+        }
+
+        handlers.get(msg.streamId)?.(msg);
+      },
+    };
+
+    streamRouters.set(transport, router);
+    transport.addEventListener('message', router.onMessage);
+  }
+
+  router.handlers.set(streamId, handler);
+}
+
+export function removeStreamListener(
+  transport: Transport<Connection>,
+  streamId: string,
+) {
+  const router = streamRouters.get(transport);
+  if (!router) {
+    return;
+  }
+
+  router.handlers.delete(streamId);
+
+  // drop the shared listener once the last stream is gone
+  if (router.handlers.size === 0) {
+    transport.removeEventListener('message', router.onMessage);
+    streamRouters.delete(transport);
+  }
+}
+
 export const CONNECTION_GRACE_PERIOD_MS = 5_000; // 5s
 export function rejectAfterDisconnectGrace(
   from: TransportClientId,
@@ -242,6 +299,37 @@ export function rejectAfterDisconnectGrace(
   };
 }
 
+/**
+ * Sends everything pushed to the input stream to the server, followed by a close
+ * once the input stream ends. Shared by streams and uploads.
+ * @param needsOpen Whether the first input message has to open the stream, i.e. no init message was sent.
+ */
+async function pipeInputToTransport(
+  transport: Transport<Connection>,
+  serverId: TransportClientId,
+  streamId: string,
+  inputStream: Pushable<unknown>,
+  serviceName: string,
+  procName: string,
+  needsOpen: boolean,
+) {
+  for await (const rawIn of inputStream) {
+    const m = msg(transport.clientId, serverId, streamId, rawIn as object);
+
+    if (needsOpen) {
+      m.serviceName = serviceName;
+      m.procedureName = procName;
+      m.controlFlags |= ControlFlags.StreamOpenBit;
+      needsOpen = false;
+    }
+
+    transport.send(m);
+  }
+
+  // after ending input stream, send a close message to the server
+  transport.send(closeStream(transport.clientId, serverId, streamId));
+}
+
 function handleRpc(
   transport: Transport<Connection>,
   serverId: TransportClientId,
@@ -277,27 +365,17 @@ function handleRpc(
     });
 
     function cleanup() {
-      transport.removeEventListener('message', onMessage);
+      removeStreamListener(transport, streamId);
       transport.removeEventListener('connectionStatus', onConnectionStatus);
     }
 
     function onMessage(msg: OpaqueTransportMessage) {
-      if (msg.streamId !== streamId) {
-        return;
-      }
-
-      if (msg.to !== transport.clientId) {
-        return;
-      }
-
-      if (msg.streamId === streamId) {
-        // cleanup and resolve as soon as we get a message
-        cleanup();
-        resolve(msg.payload);
-      }
+      // cleanup and resolve as soon as we get a message
+      cleanup();
+      resolve(msg.payload);
     }
 
-    transport.addEventListener('message', onMessage);
+    addStreamListener(transport, streamId, onMessage);
     transport.addEventListener('connectionStatus', onConnectionStatus);
   });
   return responsePromise;
@@ -313,7 +391,6 @@ function handleStream(
   const streamId = nanoid();
   const inputStream = pushable({ objectMode: true });
   const outputStream = pushable({ objectMode: true });
-  let firstMessage = true;
 
   if (init) {
     const m = msg(
@@ -328,39 +405,22 @@ function handleStream(
     // first message needs the open bit.
     m.controlFlags = ControlFlags.StreamOpenBit;
     transport.send(m);
-    firstMessage = false;
   }
 
   // input -> transport
   // this gets cleaned up on inputStream.end() which is called by closeHandler
-  (async () => {
-    for await (const rawIn of inputStream) {
-      const m = msg(transport.clientId, serverId, streamId, rawIn as object);
-
-      if (firstMessage) {
-        m.serviceName = serviceName;
-        m.procedureName = procName;
-        m.controlFlags |= ControlFlags.StreamOpenBit;
-        firstMessage = false;
-      }
-
-      transport.send(m);
-    }
-
-    // after ending input stream, send a close message to the server
-    transport.send(closeStream(transport.clientId, serverId, streamId));
-  })();
+  pipeInputToTransport(
+    transport,
+    serverId,
+    streamId,
+    inputStream,
+    serviceName,
+    procName,
+    !init,
+  );
 
   // transport -> output
   function onMessage(msg: OpaqueTransportMessage) {
-    if (msg.streamId !== streamId) {
-      return;
-    }
-
-    if (msg.to !== transport.clientId) {
-      return;
-    }
-
     if (isStreamClose(msg.controlFlags)) {
       cleanup();
     } else {
@@ -371,7 +431,7 @@ function handleStream(
   function cleanup() {
     inputStream.end();
     outputStream.end();
-    transport.removeEventListener('message', onMessage);
+    removeStreamListener(transport, streamId);
     transport.removeEventListener('connectionStatus', onConnectionStatus);
   }
 
@@ -391,7 +451,7 @@ function handleStream(
     cleanup();
   });
 
-  transport.addEventListener('message', onMessage);
+  addStreamListener(transport, streamId, onMessage);
   transport.addEventListener('connectionStatus', onConnectionStatus);
   return [inputStream, outputStream, closeHandler];
 }
@@ -418,14 +478,6 @@ function handleSubscribe(
   // transport -> output
   const outputStream = pushable({ objectMode: true });
   function onMessage(msg: OpaqueTransportMessage) {
-    if (msg.streamId !== streamId) {
-      return;
-    }
-
-    if (msg.to !== transport.clientId) {
-      return;
-    }
-
     if (isStreamClose(msg.controlFlags)) {
       cleanup();
     } else {
@@ -435,7 +487,7 @@ function handleSubscribe(
 
   function cleanup() {
     outputStream.end();
-    transport.removeEventListener('message', onMessage);
+    removeStreamListener(transport, streamId);
     transport.removeEventListener('connectionStatus', onConnectionStatus);
   }
 
@@ -455,7 +507,7 @@ function handleSubscribe(
     cleanup();
   });
 
-  transport.addEventListener('message', onMessage);
+  addStreamListener(transport, streamId, onMessage);
   transport.addEventListener('connectionStatus', onConnectionStatus);
   return [outputStream, closeHandler];
 }
@@ -469,7 +521,6 @@ function handleUpload(
 ) {
   const streamId = nanoid();
   const inputStream = pushable({ objectMode: true });
-  let firstMessage = true;
 
   if (input) {
     const m = msg(
@@ -484,27 +535,19 @@ function handleUpload(
     // first message needs the open bit.
     m.controlFlags = ControlFlags.StreamOpenBit;
     transport.send(m);
-    firstMessage = false;
   }
 
   // input -> transport
   // this gets cleaned up on inputStream.end(), which the caller should call.
-  (async () => {
-    for await (const rawIn of inputStream) {
-      const m = msg(transport.clientId, serverId, streamId, rawIn as object);
-
-      if (firstMessage) {
-        m.controlFlags |= ControlFlags.StreamOpenBit;
-        m.serviceName = serviceName;
-        m.procedureName = procName;
-        firstMessage = false;
-      }
-
-      transport.send(m);
-    }
-
-    transport.send(closeStream(transport.clientId, serverId, streamId));
-  })();
+  pipeInputToTransport(
+    transport,
+    serverId,
+    streamId,
+    inputStream,
+    serviceName,
+    procName,
+    !input,
+  );
 
   const responsePromise = new Promise((resolve) => {
     // on disconnect, set a timer to return an error
@@ -521,23 +564,17 @@ function handleUpload(
 
     function cleanup() {
       inputStream.end();
-      transport.removeEventListener('message', onMessage);
+      removeStreamListener(transport, streamId);
       transport.removeEventListener('connectionStatus', onConnectionStatus);
     }
 
     function onMessage(msg: OpaqueTransportMessage) {
-      if (msg.to !== transport.clientId) {
-        return;
-      }
-
-      if (msg.streamId === streamId) {
-        // cleanup and resolve as soon as we get a message
-        cleanup();
-        resolve(msg.payload);
-      }
+      // cleanup and resolve as soon as we get a message
+      cleanup();
+      resolve(msg.payload);
     }
 
-    transport.addEventListener('message', onMessage);
+    addStreamListener(transport, streamId, onMessage);
     transport.addEventListener('connectionStatus', onConnectionStatus);
   });
   return [inputStream, responsePromise];
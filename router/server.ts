@@ -1,4 +1,4 @@
-import { Static } from '@sinclair/typebox';
+import { Static, TSchema } from '@sinclair/typebox';
 import { Connection, Transport } from '../transport/transport';
 import { AnyProcedure, AnyService, PayloadType } from './builder';
 import { pushable } from 'it-pushable';
@@ -11,10 +11,10 @@ import {
   reply,
   closeStream,
   TransportClientId,
+  compileChecker,
 } from '../transport/message';
 import { ServiceContext, ServiceContextWithState } from './context';
 import { log } from '../logging';
-import { Value } from '@sinclair/typebox/value';
 import {
   Err,
   Result,
@@ -25,6 +25,21 @@ import {
 import { EventMap } from '../transport/events';
 import { ServiceDefs } from './defs';
 
+// procedure schemas live as long as the server does so we compile
+// each one the first time it's used and reuse it for every message after
+const compiledCheckers = new WeakMap<TSchema, (value: unknown) => boolean>();
+function checkPayload(schema: TSchema, payload: unknown) {
+  let check = compiledCheckers.get(schema);
+  if (!check) {
+    check = compileChecker(schema);
+    compiledCheckers.set(schema, check);
+  }
+
+  return check(payload);
+}
+
+const isControlMessagePayload = compileChecker(ControlMessagePayloadSchema);
+
 /**
  * Represents a server with a set of services. Use {@link createServer} to create it.
  * @template Services - The type of services provided by the server.
@@ -322,11 +337,11 @@ class RiverServer<Services extends ServiceDefs> {
     if (
       (isInit &&
         procHasInitMessage &&
-        Value.Check(procedure.init, message.payload)) ||
-      Value.Check(procedure.input, message.payload)
+        checkPayload(procedure.init, message.payload)) ||
+      checkPayload(procedure.input, message.payload)
     ) {
       procStream.incoming.push(message.payload as PayloadType);
-    } else if (!Value.Check(ControlMessagePayloadSchema, message.payload)) {
+    } else if (!isControlMessagePayload(message.payload)) {
       log?.error(
         `${this.transport.clientId} -- procedure ${procStream.serviceName}.${
           procStream.procedureName
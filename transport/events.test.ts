@@ -0,0 +1,71 @@
+import { describe, test, expect, vi } from 'vitest';
+import { EventDispatcher } from './events';
+import { createDummyTransportMessage } from '../util/testHelpers';
+
+describe('event dispatcher', () => {
+  test('adding a handler twice is a no-op', () => {
+    const dispatcher = new EventDispatcher<'message'>();
+    const handler = vi.fn();
+
+    dispatcher.addEventListener('message', handler);
+    dispatcher.addEventListener('message', handler);
+    expect(dispatcher.numberOfListeners('message')).toEqual(1);
+
+    dispatcher.dispatchEvent('message', createDummyTransportMessage());
+    expect(handler).toHaveBeenCalledTimes(1);
+
+    dispatcher.removeEventListener('message', handler);
+    expect(dispatcher.numberOfListeners('message')).toEqual(0);
+  });
+
+  test('handlers added during dispatch see the current event', () => {
+    const dispatcher = new EventDispatcher<'message'>();
+    const added = vi.fn();
+    const adder = vi.fn(() => dispatcher.addEventListener('message', added));
+    dispatcher.addEventListener('message', adder);
+
+    dispatcher.dispatchEvent('message', createDummyTransportMessage());
+    expect(adder).toHaveBeenCalledTimes(1);
+    expect(added).toHaveBeenCalledTimes(1);
+
+    dispatcher.dispatchEvent('message', createDummyTransportMessage());
+    expect(adder).toHaveBeenCalledTimes(2);
+    expect(added).toHaveBeenCalledTimes(2);
+  });
+
+  test('handlers removed during dispatch are skipped', () => {
+    const dispatcher = new EventDispatcher<'message'>();
+    const removed = vi.fn();
+    const remover = vi.fn(() =>
+      dispatcher.removeEventListener('message', removed),
+    );
+    const other = vi.fn();
+    dispatcher.addEventListener('message', remover);
+    dispatcher.addEventListener('message', removed);
+    dispatcher.addEventListener('message', other);
+
+    dispatcher.dispatchEvent('message', createDummyTransportMessage());
+    expect(remover).toHaveBeenCalledTimes(1);
+    expect(removed).toHaveBeenCalledTimes(0);
+    expect(other).toHaveBeenCalledTimes(1);
+    expect(dispatcher.numberOfListeners('message')).toEqual(2);
+  });
+
+  test('handlers can remove themselves during dispatch', () => {
+    const dispatcher = new EventDispatcher<'message'>();
+    const once = vi.fn();
+    const onceHandler = () => {
+      once();
+      dispatcher.removeEventListener('message', onceHandler);
+    };
+    const other = vi.fn();
+    dispatcher.addEventListener('message', onceHandler);
+    dispatcher.addEventListener('message', other);
+
+    dispatcher.dispatchEvent('message', createDummyTransportMessage());
+    dispatcher.dispatchEvent('message', createDummyTransportMessage());
+    expect(once).toHaveBeenCalledTimes(1);
+    expect(other).toHaveBeenCalledTimes(2);
+    expect(dispatcher.numberOfListeners('message')).toEqual(1);
+  });
+});
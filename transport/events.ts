@@ -20,18 +20,17 @@ export class EventDispatcher<T extends EventTypes> {
   }
 
   addEventListener<K extends T>(eventType: K, handler: EventHandler<K>) {
-    if (!this.eventListeners[eventType]) {
-      this.eventListeners[eventType] = new Set();
+    let handlers = this.eventListeners[eventType];
+    if (!handlers) {
+      handlers = new Set<EventHandler<K>>();
+      this.eventListeners[eventType] = handlers;
     }
 
-    this.eventListeners[eventType]?.add(handler);
+    handlers.add(handler);
   }
 
   removeEventListener<K extends T>(eventType: K, handler: EventHandler<K>) {
-    const handlers = this.eventListeners[eventType];
-    if (handlers) {
-      this.eventListeners[eventType]?.delete(handler);
-    }
+    this.eventListeners[eventType]?.delete(handler);
   }
 
   dispatchEvent<K extends T>(eventType: K, event: EventMap[K]) {
@@ -1,8 +1,10 @@
+import { Writable } from 'node:stream';
 import { Connection, Transport, TransportClientId } from '../..';
 import { defaultDelimiter } from '../../transforms/delim';
 
 export class StreamConnection extends Connection {
   output: NodeJS.WritableStream;
+  private corked = false;
 
   constructor(
     transport: Transport<StreamConnection>,
@@ -18,10 +20,32 @@ export class StreamConnection extends Connection {
       return false;
     }
 
-    return this.output.write(Buffer.concat([payload, defaultDelimiter]));
+    this.corkUntilNextTick();
+    this.output.write(Buffer.concat([payload, defaultDelimiter]));
+
+    // write() returning false only means the stream is buffering past its high water mark
+    // (always the case while corked), the data is still queued for delivery.
+    // reporting that as a failed send would make the transport send it again on reconnect
+    return true;
+  }
+
+  // coalesce all messages sent in the same tick into a single write
+  // to the underlying stream instead of flushing each one individually
+  private corkUntilNextTick() {
+    const output = this.output;
+    if (this.corked || !(output instanceof Writable)) {
+      return;
+    }
+
+    this.corked = true;
+    output.cork();
+    process.nextTick(() => {
+      this.corked = false;
+      output.uncork();
+    });
   }
 
-  async close() {
+  close() {
     this.output.end();
   }
 }
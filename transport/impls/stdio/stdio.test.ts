@@ -5,7 +5,11 @@ import {
   payloadToTransportMessage,
   waitForMessage,
 } from '../../../util/testHelpers';
-import { ensureTransportIsClean } from '../../../__tests__/fixtures/cleanup';
+import {
+  ensureTransportIsClean,
+  waitFor,
+} from '../../../__tests__/fixtures/cleanup';
+import { OpaqueTransportMessage } from '../../message';
 
 describe('sending and receiving across node streams works', () => {
   test('basic send/receive', async () => {
@@ -54,4 +58,46 @@ describe('sending and receiving across node streams works', () => {
     await ensureTransportIsClean(clientTransport);
     await ensureTransportIsClean(serverTransport);
   });
+
+  test('messages past the high water mark are delivered exactly once', async () => {
+    const clientToServer = new stream.PassThrough();
+    const serverToClient = new stream.PassThrough();
+    const serverTransport = new StdioTransport(
+      'abc',
+      clientToServer,
+      serverToClient,
+    );
+    const clientTransport = new StdioTransport(
+      'def',
+      serverToClient,
+      clientToServer,
+    );
+
+    const received: string[] = [];
+    const onMessage = (msg: OpaqueTransportMessage) => received.push(msg.id);
+    serverTransport.addEventListener('message', onMessage);
+
+    // ~30KB sent in a single tick, well past the default 16KB high water mark
+    const sent = Array.from({ length: 10 }, (_, i) =>
+      payloadToTransportMessage(
+        { i, data: 'x'.repeat(3000) },
+        'stream',
+        clientTransport.clientId,
+        serverTransport.clientId,
+      ),
+    );
+    for (const msg of sent) {
+      clientTransport.send(msg);
+    }
+
+    await waitFor(() => expect(received).toHaveLength(sent.length));
+    await waitFor(() => expect(clientTransport.sendBuffer.size).toEqual(0));
+    expect(received).toStrictEqual(sent.map((msg) => msg.id));
+
+    serverTransport.removeEventListener('message', onMessage);
+    await clientTransport.close();
+    await serverTransport.close();
+    await ensureTransportIsClean(clientTransport);
+    await ensureTransportIsClean(serverTransport);
+  });
 });
@@ -58,7 +58,11 @@ export class WebSocketClientTransport extends Transport<WebSocketConnection> {
     this.createNewConnection(this.serverId);
   }
 
-  async createNewConnection(to: string, attempt = 0) {
+  async createNewConnection(
+    to: string,
+    attempt = 0,
+    prevBackoffMs = this.options.retryIntervalMs,
+  ) {
     if (this.state === 'destroyed') {
       throw new Error('cant reopen a destroyed connection');
     }
@@ -137,15 +141,22 @@ export class WebSocketClientTransport extends Transport<WebSocketConnection> {
         `${this.clientId} -- websocket to ${to} failed after ${attempt} attempts, giving up`,
       );
     } else {
-      // linear backoff
+      // decorrelated jitter so that clients which lost their connection at the
+      // same time don't all reconnect in lockstep. each delay is drawn from
+      // [retryIntervalMs, 3 * previous delay] and capped at
+      // retryIntervalMs * retryAttemptsMax
+      const { retryIntervalMs, retryAttemptsMax } = this.options;
+      const maxBackoffMs = retryIntervalMs * retryAttemptsMax;
+      const spreadMs = prevBackoffMs * 3 - retryIntervalMs;
+      const backoffMs = Math.round(
+        Math.min(maxBackoffMs, retryIntervalMs + Math.random() * spreadMs),
+      );
       log?.warn(
-        `${this.clientId} -- websocket to ${to} failed, trying again in ${
-          this.options.retryIntervalMs * attempt
-        }ms`,
+        `${this.clientId} -- websocket to ${to} failed, trying again in ${backoffMs}ms`,
       );
       setTimeout(
-        () => this.createNewConnection(to, attempt + 1),
-        this.options.retryIntervalMs * attempt,
+        () => this.createNewConnection(to, attempt + 1, backoffMs),
+        backoffMs,
       );
     }
   }
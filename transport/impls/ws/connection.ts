@@ -27,7 +27,7 @@ export class WebSocketConnection extends Connection {
     }
   }
 
-  async close() {
+  close() {
     this.ws.close();
   }
 }
@@ -1,5 +1,6 @@
 import http from 'node:http';
-import { describe, test, expect, afterAll } from 'vitest';
+import { describe, test, expect, afterAll, vi } from 'vitest';
+import WebSocket from 'isomorphic-ws';
 import {
   createWebSocketServer,
   createWsTransports,
@@ -11,7 +12,11 @@ import {
 import { msg } from '../..';
 import { WebSocketServerTransport } from './server';
 import { WebSocketClientTransport } from './client';
-import { testFinishesCleanly } from '../../../__tests__/fixtures/cleanup';
+import {
+  ensureTransportIsClean,
+  testFinishesCleanly,
+  waitFor,
+} from '../../../__tests__/fixtures/cleanup';
 
 describe('sending and receiving across websockets works', async () => {
   const server = http.createServer();
@@ -138,3 +143,46 @@ describe('reconnect', async () => {
     });
   });
 });
+
+describe('reconnect backoff', () => {
+  test('retries back off with decorrelated jitter', async () => {
+    const delays: Array<number> = [];
+    const setTimeoutSpy = vi
+      .spyOn(globalThis, 'setTimeout')
+      .mockImplementation(((cb: () => void, ms?: number) => {
+        delays.push(ms ?? 0);
+        // stop retrying once we've seen enough delays
+        if (delays.length < 4) {
+          cb();
+        }
+
+        return 0;
+      }) as unknown as typeof setTimeout);
+    const randomSpy = vi
+      .spyOn(Math, 'random')
+      .mockReturnValueOnce(0)
+      .mockReturnValueOnce(1)
+      .mockReturnValueOnce(1)
+      .mockReturnValueOnce(0.5);
+
+    // every connection attempt fails straight away
+    const closedWs = { readyState: 3, OPEN: 1, CLOSING: 2, CLOSED: 3 };
+    const clientTransport = new WebSocketClientTransport(
+      async () => closedWs as unknown as WebSocket,
+      'client',
+      'SERVER',
+      { retryIntervalMs: 100, retryAttemptsMax: 5 },
+    );
+
+    await waitFor(() => expect(delays).toHaveLength(4));
+    setTimeoutSpy.mockRestore();
+    randomSpy.mockRestore();
+
+    // the first retry is never sooner than retryIntervalMs, later ones grow
+    // from the previous delay up to retryIntervalMs * retryAttemptsMax
+    expect(delays).toStrictEqual([100, 300, 500, 500]);
+
+    await clientTransport.close();
+    await ensureTransportIsClean(clientTransport);
+  });
+});
@@ -1,4 +1,6 @@
 import { Type, TSchema, Static } from '@sinclair/typebox';
+import { Value } from '@sinclair/typebox/value';
+import { TypeCompiler } from '@sinclair/typebox/compiler';
 import { nanoid } from 'nanoid';
 
 /**
@@ -142,6 +144,11 @@ export function reply<Payload extends object>(
   };
 }
 
+// the close payload never changes so share one (frozen) instance between all close messages
+const CLOSE_PAYLOAD = Object.freeze({
+  type: 'CLOSE' as const,
+} satisfies Static<typeof ControlMessagePayloadSchema>);
+
 /**
  * Create a request to close a stream
  * @param from The ID of the client initiating the close.
@@ -154,9 +161,7 @@ export function closeStream(
   to: TransportClientId,
   stream: string,
 ) {
-  const closeMessage = msg(from, to, stream, {
-    type: 'CLOSE' as const,
-  } satisfies Static<typeof ControlMessagePayloadSchema>);
+  const closeMessage = msg(from, to, stream, CLOSE_PAYLOAD);
   closeMessage.controlFlags |= ControlFlags.StreamClosedBit;
   return closeMessage;
 }
@@ -192,3 +197,21 @@ export function isStreamClose(controlFlag: number): boolean {
     ControlFlags.StreamClosedBit
   );
 }
+
+/**
+ * Builds a validator for the given schema. Compiled validators are much faster than
+ * walking the schema with {@link Value.Check} on every message but rely on code generation,
+ * so we fall back to the interpreted check where that isn't allowed (e.g. strict CSP).
+ * @param schema The schema to validate against.
+ * @returns A type guard for the schema.
+ */
+export function compileChecker<T extends TSchema>(
+  schema: T,
+): (value: unknown) => value is Static<T> {
+  try {
+    const compiled = TypeCompiler.Compile(schema);
+    return (value): value is Static<T> => compiled.Check(value);
+  } catch {
+    return (value): value is Static<T> => Value.Check(schema, value);
+  }
+}
@@ -28,7 +28,10 @@ export class DelimiterParser extends Transform {
   // implemented backpressure properly
   // see: https://nodejs.org/en/guides/backpressuring-in-streams#lifecycle-of-pipe
   _transform(chunk: Buffer, _encoding: BufferEncoding, cb: TransformCallback) {
-    let data = Buffer.concat([this.buffer, chunk]);
+    // most chunks arrive with nothing left over from the previous one,
+    // in which case we can slice messages straight out of the chunk without copying it
+    let data =
+      this.buffer.length === 0 ? chunk : Buffer.concat([this.buffer, chunk]);
     let position;
     while ((position = data.indexOf(this.delimiter)) !== -1) {
       this.push(data.subarray(0, position));
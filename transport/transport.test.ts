@@ -140,4 +140,43 @@ describe.each(transports)('transport -- $name', async ({ setup }) => {
     await clientTransport.close();
     await serverTransport.close();
   });
+
+  test('close and destroy are idempotent', async () => {
+    const [clientTransport, serverTransport] = getTransports();
+    const msg1 = createDummyTransportMessage();
+    const msg2 = createDummyTransportMessage();
+
+    const promise1 = waitForMessage(
+      serverTransport,
+      (recv) => recv.id === msg1.id,
+    );
+    clientTransport.send(msg1);
+    await expect(promise1).resolves.toStrictEqual(msg1.payload);
+
+    await clientTransport.close();
+    expect(clientTransport.state).toEqual('closed');
+    await clientTransport.close();
+    expect(clientTransport.state).toEqual('closed');
+    expect(clientTransport.connections.size).toEqual(0);
+
+    await clientTransport.destroy();
+    expect(clientTransport.state).toEqual('destroyed');
+    await clientTransport.destroy();
+    expect(clientTransport.state).toEqual('destroyed');
+
+    // closing after destroy shouldn't bring the transport back to closed
+    await clientTransport.close();
+    expect(clientTransport.state).toEqual('destroyed');
+    expect(() => clientTransport.send(msg2)).toThrow(
+      new Error('transport is destroyed, cant send'),
+    );
+
+    await serverTransport.close();
+    await testFinishesCleanly({
+      clientTransports: [clientTransport],
+      serverTransport,
+    });
+    expect(clientTransport.state).toEqual('destroyed');
+    expect(serverTransport.state).toEqual('closed');
+  });
 });
@@ -1,5 +1,4 @@
 import { Codec } from '../codec/types';
-import { Value } from '@sinclair/typebox/value';
 import {
   ControlFlags,
   MessageId,
@@ -7,12 +6,20 @@ import {
   OpaqueTransportMessageSchema,
   TransportAckSchema,
   TransportClientId,
+  compileChecker,
   isAck,
   reply,
 } from './message';
-import { log } from '../logging';
+import { isLevelEnabled, log } from '../logging';
 import { EventDispatcher, EventHandler, EventTypes } from './events';
 
+const isOpaqueTransportMessage = compileChecker(OpaqueTransportMessageSchema);
+const decoder = new TextDecoder();
+
+// the envelope has already been validated by the time we look at acks, so we
+// only need to check the payload rather than the whole TransportAckSchema again
+const isAckPayload = compileChecker(TransportAckSchema.properties.payload);
+
 /**
  * A 1:1 connection between two transports. Once this is created,
  * the {@link Connection} is expected to take over responsibility for
@@ -202,22 +209,24 @@ export abstract class Transport<ConnType extends Connection> {
     const parsedMsg = this.codec.fromBuffer(msg);
 
     if (parsedMsg === null) {
-      const decodedBuffer = new TextDecoder().decode(msg);
+      const decodedBuffer = decoder.decode(msg);
       log?.warn(`${this.clientId} -- received malformed msg: ${decodedBuffer}`);
       return null;
     }
 
-    if (Value.Check(OpaqueTransportMessageSchema, parsedMsg)) {
+    if (isOpaqueTransportMessage(parsedMsg)) {
       // JSON can't express the difference between `undefined` and `null`, so we need to patch that.
-      return {
-        ...parsedMsg,
-        serviceName:
-          parsedMsg.serviceName === null ? undefined : parsedMsg.serviceName,
-        procedureName:
-          parsedMsg.procedureName === null
-            ? undefined
-            : parsedMsg.procedureName,
-      };
+      // Codec.fromBuffer must return a fresh object that we own, so it's safe to patch in place
+      // rather than copying every field into a new object per message
+      if (parsedMsg.serviceName === null) {
+        parsedMsg.serviceName = undefined;
+      }
+
+      if (parsedMsg.procedureName === null) {
+        parsedMsg.procedureName = undefined;
+      }
+
+      return parsedMsg as OpaqueTransportMessage;
     } else {
       log?.warn(
         `${this.clientId} -- received invalid msg: ${JSON.stringify(
@@ -238,18 +247,23 @@ export abstract class Transport<ConnType extends Connection> {
       return;
     }
 
-    if (isAck(msg.controlFlags) && Value.Check(TransportAckSchema, msg)) {
+    const ack = isAck(msg.controlFlags);
+    if (ack && isAckPayload(msg.payload)) {
       // process ack
-      log?.debug(`${this.clientId} -- received ack: ${JSON.stringify(msg)}`);
-      if (this.sendBuffer.has(msg.payload.ack)) {
-        this.sendBuffer.delete(msg.payload.ack);
+      if (isLevelEnabled('debug')) {
+        log?.debug(`${this.clientId} -- received ack: ${JSON.stringify(msg)}`);
       }
+
+      this.sendBuffer.delete(msg.payload.ack);
     } else {
       // regular river message
-      log?.debug(`${this.clientId} -- received msg: ${JSON.stringify(msg)}`);
+      if (isLevelEnabled('debug')) {
+        log?.debug(`${this.clientId} -- received msg: ${JSON.stringify(msg)}`);
+      }
+
       this.eventDispatcher.dispatchEvent('message', msg);
 
-      if (!isAck(msg.controlFlags)) {
+      if (!ack) {
         const ackMsg = reply(msg, { ack: msg.id });
         ackMsg.controlFlags = ControlFlags.AckBit;
         ackMsg.from = this.clientId;
@@ -295,13 +309,16 @@ export abstract class Transport<ConnType extends Connection> {
       log?.error(`${this.clientId} -- ` + err + `: ${JSON.stringify(msg)}`);
       throw new Error(err);
     } else if (this.state === 'closed') {
-      log?.info(
-        `${
-          this.clientId
-        } -- transport closed when sending, discarding : ${JSON.stringify(
-          msg,
-        )}`,
-      );
+      if (isLevelEnabled('info')) {
+        log?.info(
+          `${
+            this.clientId
+          } -- transport closed when sending, discarding : ${JSON.stringify(
+            msg,
+          )}`,
+        );
+      }
+
       return msg.id;
     }
 
@@ -314,18 +331,24 @@ export abstract class Transport<ConnType extends Connection> {
     }
 
     if (conn) {
-      log?.debug(`${this.clientId} -- sending ${JSON.stringify(msg)}`);
+      if (isLevelEnabled('debug')) {
+        log?.debug(`${this.clientId} -- sending ${JSON.stringify(msg)}`);
+      }
+
       const ok = conn.send(this.codec.toBuffer(msg));
       if (ok) {
         return msg.id;
       }
     }
 
-    log?.info(
-      `${this.clientId} -- connection to ${
-        msg.to
-      } not ready, attempting reconnect and queuing ${JSON.stringify(msg)}`,
-    );
+    if (isLevelEnabled('info')) {
+      log?.info(
+        `${this.clientId} -- connection to ${
+          msg.to
+        } not ready, attempting reconnect and queuing ${JSON.stringify(msg)}`,
+      );
+    }
+
     const outstanding = this.sendQueue.get(msg.to) || [];
     outstanding.push(msg.id);
     this.sendQueue.set(msg.to, outstanding);
@@ -344,6 +367,13 @@ export abstract class Transport<ConnType extends Connection> {
     }
 
     this.connections.clear();
+
+    // connections can still get registered after a close, so always tear them down
+    // but don't move an already closed or destroyed transport back to closed
+    if (this.state !== 'open') {
+      return;
+    }
+
     this.state = 'closed';
     log?.info(`${this.clientId} -- closed transport`);
   }
@@ -359,6 +389,10 @@ export abstract class Transport<ConnType extends Connection> {
     }
 
     this.connections.clear();
+    if (this.state === 'destroyed') {
+      return;
+    }
+
     this.state = 'destroyed';
     log?.info(`${this.clientId} -- destroyed transport`);
   }